@@ -313,8 +313,7 @@ class Base:
 
         g = self.load(self.g_new)
         p = self.load(self.p_new)
-        x = self.line_search.search_history()[0]
-        f = self.line_search.search_history()[1]
+        x, f = self.line_search.search_history()[:2]
 
         # Clean scratch directory
         unix.cd(PATH.OPTIMIZE)
@@ -452,7 +451,7 @@ class Base:
                              )
 
     @staticmethod
-    def load(filename):
+    def load(filename, mmap_mode=None):
         """
         Convenience function to reads vectors from disk as Numpy files,
         reads directly from PATH.OPTIMIZE. Works around Numpy's behavior of
@@ -460,13 +459,17 @@ class Base:
 
         :type filename: str
         :param filename: filename to read from
+        :type mmap_mode: str
+        :param mmap_mode: optional memory-map mode passed to np.load(), e.g.,
+            'r' to read the vector lazily from disk rather than copying the
+            entire vector into memory
         :rtype: np.array
         :return: vector read from disk
         """
         fid = os.path.join(PATH.OPTIMIZE, filename)
         if not os.path.exists(fid):
             fid += ".npy"
-        return np.load(fid)
+        return np.load(fid, mmap_mode=mmap_mode)
 
     @staticmethod
     def save(filename, array):
@@ -7,12 +7,9 @@ have any agency (i.e. it should not be able to iterate its own step count etc.,
 this should be completely left to the optimization algorithm to keep everything
 in one place)
 """
-import os
 import logging
 import numpy as np
 
-from seisflows.tools.array import count_zeros
-
 
 class Base:
     """
@@ -34,7 +31,13 @@ class Base:
     # Class-specific logger accessed using self.logger
     logger = logging.getLogger(__name__).getChild(__qualname__)
 
-    def __init__(self, step_count_max, step_len_max, log_file):
+    # Formatting of the line search history file, see write_log()
+    _log_header = (f"{'ITER':>10}  {'STEPLEN':>10}  {'MISFIT':>10}\n"
+                   f"{'='*10}  {'='*10}  {'='*10}\n")
+    _log_line = "{:>10}  {:10.3e}  {:10.3e}\n"
+
+    def __init__(self, step_count_max, step_len_max, log_file,
+                 max_history=None, max_searches=4):
         """
 
         :type step_count_max: int
@@ -45,6 +48,16 @@ class Base:
             that is unbounded step length. set by PAR.STEP_LEN_MAX
         :type log_file: str
         :param log_file: path to write line search stats to. set by optimize.setup()
+            If None, no line search history file is written
+        :type max_history: int
+        :param max_history: number of step lengths and function values to
+            preallocate memory for. The history is grown if this is exceeded.
+            Defaults to the length of a single line search, step_count_max + 1,
+            to keep checkpoints of this object small
+        :type max_searches: int
+        :param max_searches: number of searches (i.e., iterations) to
+            preallocate memory for dot products, which are stored once per
+            search. Grown if this is exceeded
         """
         # Set maximum number of trial steps
         self.step_count_max = step_count_max
@@ -55,17 +68,114 @@ class Base:
         else:
             self.step_len_max = step_len_max
 
-        # Write header information to line search file
+        # Write header information to line search file. Subsequent lines are
+        # held in memory and written once the search completes (see flush_log)
         self.log = log_file
+        self._pending_log_lines = []
+        self._log_exists = False
         self.write_log()
 
-        # Prepare lists for line search history
-        self.func_vals = []
-        self.step_lens = []
-        self.gtg = []
-        self.gtp = []
+        # Prepare line search history. Step lengths and function values are
+        # kept in preallocated arrays, filled up to index `_k`, which are grown
+        # as required. Accessed through the `step_lens` and `func_vals` views
+        if max_history is None:
+            max_history = step_count_max + 1
+        max_history = max(max_history, 1)
+        self._step_lens = np.empty(max_history)
+        self._func_vals = np.empty(max_history)
+        self._k = 0
         self.step_count = 0
 
+        # Dot products are stored once per search in the same manner, filled up
+        # to index `_n_search`, accessed through the `gtg` and `gtp` views
+        self._gtg = np.empty(max(max_searches, 1), dtype=np.float64)
+        self._gtp = np.empty(max(max_searches, 1), dtype=np.float64)
+        self._n_search = 0
+
+        # Number of zero step lengths in the history, i.e., number of searches
+        self._n_zeros = 0
+
+    @property
+    def step_lens(self):
+        """
+        Step lengths for the entire line search history
+
+        :rtype: np.array
+        :return: view of the filled portion of the step length array
+        """
+        return self._step_lens[:self._k]
+
+    @property
+    def func_vals(self):
+        """
+        Function evaluations for the entire line search history
+
+        :rtype: np.array
+        :return: view of the filled portion of the function value array
+        """
+        return self._func_vals[:self._k]
+
+    @property
+    def gtg(self):
+        """
+        Dot products of the gradient with itself, one for each search
+
+        :rtype: np.array
+        :return: view of the filled portion of the gtg array
+        """
+        return self._gtg[:self._n_search]
+
+    @property
+    def gtp(self):
+        """
+        Dot products of the gradient with the search direction, one for each
+        search
+
+        :rtype: np.array
+        :return: view of the filled portion of the gtp array
+        """
+        return self._gtp[:self._n_search]
+
+    def _append_history(self, step_len, func_val):
+        """
+        Append a step length and its corresponding function evaluation to the
+        line search history, doubling the size of the preallocated arrays if
+        they are full
+
+        :type step_len: float
+        :param step_len: step length to append to the history
+        :type func_val: float
+        :param func_val: function evaluation to append to the history
+        """
+        if self._k == len(self._step_lens):
+            self._step_lens = np.append(self._step_lens, np.empty(self._k))
+            self._func_vals = np.append(self._func_vals, np.empty(self._k))
+
+        self._step_lens[self._k] = step_len
+        self._func_vals[self._k] = func_val
+        self._k += 1
+
+        if step_len == 0:
+            self._n_zeros += 1
+
+    def _append_dot_products(self, gtg, gtp):
+        """
+        Append the dot products for a new search to the line search history,
+        doubling the size of the preallocated arrays if they are full
+
+        :type gtg: float
+        :param gtg: dot product of the gradient with itself
+        :type gtp: float
+        :param gtp: dot product of gradient `g` with search direction `p`
+        """
+        if self._n_search == len(self._gtg):
+            self._gtg = np.append(self._gtg, np.empty(self._n_search))
+            self._gtp = np.append(self._gtp, np.empty(self._n_search))
+
+        self._gtg[self._n_search] = gtg
+        self._gtp[self._n_search] = gtp
+        self._n_search += 1
+
     def initialize(self, iter, step_len, func_val, gtg, gtp):
         """
         Initialize a new search from step count 0 and calculate the step
@@ -87,12 +197,10 @@ class Base:
         :return status: current status of the line search
         """
         self.step_count = 0
-        self.step_lens += [step_len]
-        self.func_vals += [func_val]
-        self.gtg += [gtg]
-        self.gtp += [gtp]
+        self._append_history(step_len, func_val)
+        self._append_dot_products(gtg, gtp)
 
-        # Write the current misfit evaluation to disk
+        # Record the current misfit evaluation for the line search log
         self.write_log(iter=iter, step_len=step_len, func_val=func_val)
 
         # Call calculate step, must be implemented by subclass
@@ -119,26 +227,28 @@ class Base:
         """
         # This has been moved into workflow.line_search()
         # self.step_count += 1
-        self.step_lens += [step_len]
-        self.func_vals += [func_val]
+        self._append_history(step_len, func_val)
 
-        # Write the current misfit evaluation to disk
+        # Record the current misfit evaluation for the line search log
         self.write_log(iter=iter, step_len=step_len, func_val=func_val)
 
         # Call calcuate step, must be implemented by subclass
         alpha, status = self.calculate_step()
 
+        # Line search has either passed or failed, write out its history
+        if status != 0:
+            self.flush_log()
+
         return alpha, status
 
     def clear_history(self):
         """
         Clears internal line search history
         """
-        self.func_vals = []
-        self.step_lens = []
-        self.gtg = []
-        self.gtp = []
+        self._k = 0
+        self._n_search = 0
         self.step_count = 0
+        self._n_zeros = 0
 
     def reset(self):
         """
@@ -150,17 +260,17 @@ class Base:
         output.optim needs to have its lines cleared manually
         """
         # First step treated differently
-        if len(self.step_lens) <= 1:
+        if self._k <= 1:
             self.clear_history()
         else:
             # Wind back dot products by one
-            self.gtg = self.gtg[:-1]
-            self.gtp = self.gtp[:-1]
-            
-            # Move step lens and function evaluations by number of step count
-            original_idx = -1 * self.step_count - 1
-            self.step_lens = self.step_lens[:original_idx]
-            self.func_vals = self.func_vals[:original_idx]
+            self._n_search = max(self._n_search - 1, 0)
+
+            # Move step lens and function evaluations by number of step count.
+            # Only the discarded entries need to be checked for zero step lens
+            k = self._k
+            self._k = max(k - self.step_count - 1, 0)
+            self._n_zeros -= np.count_nonzero(self._step_lens[self._k:k] == 0)
 
     def write_log(self, iter=None, step_len=None, func_val=None):
         """
@@ -180,18 +290,36 @@ class Base:
         :param func_val: the function evaluation, i.e., the misfit, associated
             with the given step length (alpha)
         """
-        if (iter is None) or (not os.path.exists(self.log)):
+        if self.log is None:
+            return
+
+        if (iter is None) or (not self._log_exists):
             # Write out the header of the file to a NEW FILE
+            self._pending_log_lines = []
             self.logger.info(f"writing line search history file:\n{self.log}")
             with open(self.log, "w") as f:
-                f.write(f"{'ITER':>10}  {'STEPLEN':>10}  {'MISFIT':>10}\n")
-                f.write(f"{'='*10}  {'='*10}  {'='*10}\n")
+                f.write(self._log_header)
+            self._log_exists = True
         else:
-            with open(self.log, "a") as f:
-                # Aesthetic choice, don't repeat iteration numbers in the file
-                if (step_len is not None) and (step_len > 0):
-                    iter = ""
-                f.write(f"{iter:>10}  {step_len:10.3e}  {func_val:10.3e}\n")
+            # Lines are only stored here, and written to disk by flush_log()
+            # Aesthetic choice, don't repeat iteration numbers in the file
+            if (step_len is not None) and (step_len > 0):
+                iter = ""
+            self._pending_log_lines.append(
+                self._log_line.format(iter, step_len, func_val)
+            )
+
+    def flush_log(self):
+        """
+        Append all pending lines of line search history to the log file in a
+        single write. Called automatically when a line search passes or fails
+        """
+        if self.log is None or not self._pending_log_lines:
+            return
+
+        with open(self.log, "a") as f:
+            f.writelines(self._pending_log_lines)
+        self._pending_log_lines = []
 
     def search_history(self, sort=True):
         """
@@ -206,9 +334,9 @@ class Base:
         :return x: list of step lenths from current line search
         :rtype f: np.array
         :return f: correpsonding list of function values
-        :rtype gtg: list
+        :rtype gtg: np.array
         :return gtg: dot product dot product of gradient with itself
-        :rtype gtp: list
+        :rtype gtp: np.array
         :return gtp: dot product of gradient and search direction
         :rtype i: int
         :return i: step_count
@@ -216,15 +344,16 @@ class Base:
         :return j: number of iterations corresponding to 0 step length
         """
         i = self.step_count
-        j = count_zeros(self.step_lens) - 1
-        k = len(self.step_lens)
-        x = np.array(self.step_lens[k - i - 1:k])
-        f = np.array(self.func_vals[k - i - 1:k])
+        j = self._n_zeros - 1
+        k = self._k
+        x = self._step_lens[k - i - 1:k]
+        f = self._func_vals[k - i - 1:k]
 
-        # Sort by step length
+        # Sort by step length, using the same sorting indices for both arrays
         if sort:
-            f = f[abs(x).argsort()]
-            x = x[abs(x).argsort()]
+            idx = np.argsort(np.abs(x))
+            x = x[idx]
+            f = f[idx]
 
         return x, f, self.gtg, self.gtp, i, j
 
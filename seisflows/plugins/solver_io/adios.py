@@ -12,8 +12,8 @@ def mread(path, parameters, iproc, prefix='', suffix=''):
     vals = []
     for key in sorted(parameters):
         val = _read1(path, iproc, prefix+key+suffix)
-        keys += [key]
-        vals += [val]
+        keys.append(key)
+        vals.append(val)
     return keys, vals
 
 
@@ -27,7 +27,7 @@ def read_slice(path, parameters, iproc):
     
     vals = []
     for key in iterable(parameters):
-        vals += [model[available_parameters.index(key)]]
+        vals.append(model[available_parameters.index(key)])
     
     return vals
 
@@ -21,7 +21,7 @@ def read_slice(path, parameters, iproc):
     vals = []
     for key in iterable(parameters):
         filename = os.path.join(path, f"proc{int(iproc):06d}_{key}.bin")
-        vals += [_read(filename)]
+        vals.append(_read(filename))
     return vals
 
 
@@ -10,6 +10,7 @@ import sys
 import obspy
 import logging
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 from seisflows.tools import msg
 from seisflows.tools import signal, unix
@@ -286,11 +287,16 @@ class Base:
         :rtype: float
         :return: sum of squares of residuals
         """
-        total_misfit = 0.
-        for filename in files:
-            total_misfit += np.sum(np.loadtxt(filename) ** 2.)
+        if not files:
+            return 0.
 
-        return total_misfit
+        # Reading many small text files is I/O bound, so read concurrently
+        max_workers = min(len(files), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            residuals = executor.map(np.loadtxt, files)
+            total_misfit = sum(np.dot(r.ravel(), r.ravel()) for r in residuals)
+
+        return float(total_misfit)
 
     def finalize(self):
         """
@@ -92,30 +92,32 @@ class SFPyatoaEx2D(SFExample2D):
         self.sf.par("preprocess", "pyatoa")
         self.sf.configure()
 
-        self.sf.par("end", 1)  # only 1 iteration
-        self.sf.par("ntask", self.ntask)  # 3 sources for this example
-        self.sf.par("materials", "elastic")  # how velocity model parameterized
-        self.sf.par("density", "constant")  # update density or keep constant
-        self.sf.par("nt", 5000)  # set by SPECFEM2D Par_file
-        self.sf.par("dt", .06)  # set by SPECFEM2D Par_file
-        self.sf.par("f0", 0.084)  # set by SOURCE file
-        self.sf.par("format", "ascii")  # how to output synthetic seismograms
-        self.sf.par("case", "synthetic")  # synthetic-synthetic inversion
-        self.sf.par("attenuation", False)
-        self.sf.par("components", "Y")
-
-        # PYATOA preprocessing parameters
-        self.sf.par("unit_output", "DISP")
-        self.sf.par("min_period", 10)  # filter bounds define window selection
-        self.sf.par("max_period", 200)
-        self.sf.par("start_pad", 48)  # T0 set in Par_file
-        self.sf.par("end_pad", 5000 * .06)  # nt * dt defined by Par_file
-        # self.sf.par("pyflex_preset", "")  # To turn off windowing completely
-
-        self.sf.par("specfem_bin", self.workdir_paths.bin)
-        self.sf.par("specfem_data", self.workdir_paths.data)
-        self.sf.par("model_init", self.workdir_paths.model_init)
-        self.sf.par("model_true", self.workdir_paths.model_true)
+        self.par_bulk({
+            "end": 1,  # only 1 iteration
+            "ntask": self.ntask,  # 3 sources for this example
+            "materials": "elastic",  # how velocity model parameterized
+            "density": "constant",  # update density or keep constant
+            "nt": 5000,  # set by SPECFEM2D Par_file
+            "dt": .06,  # set by SPECFEM2D Par_file
+            "f0": 0.084,  # set by SOURCE file
+            "format": "ascii",  # how to output synthetic seismograms
+            "case": "synthetic",  # synthetic-synthetic inversion
+            "attenuation": False,
+            "components": "Y",
+
+            # PYATOA preprocessing parameters
+            "unit_output": "DISP",
+            "min_period": 10,  # filter bounds define window selection
+            "max_period": 200,
+            "start_pad": 48,  # T0 set in Par_file
+            "end_pad": 5000 * .06,  # nt * dt defined by Par_file
+            # "pyflex_preset": "",  # To turn off windowing completely
+
+            "specfem_bin": self.workdir_paths.bin,
+            "specfem_data": self.workdir_paths.data,
+            "model_init": self.workdir_paths.model_init,
+            "model_true": self.workdir_paths.model_true,
+        })
 
     def finalize_specfem2d_par_file(self):
         """
@@ -127,8 +129,10 @@ class SFPyatoaEx2D(SFExample2D):
         print("> EX2: Finalizing SPECFEM2D Par_file for SeisFlows inversion")
 
         cd(self.workdir_paths.data)
-        self.sf.sempar("model", "gll")  # GLL so SPECFEM reads .bin files
-        self.sf.sempar("use_existing_stations", ".true.")  # Use STATIONS file
+        self.sempar_bulk({
+            "model": "gll",  # GLL so SPECFEM reads .bin files
+            "use_existing_stations": ".true.",  # Use STATIONS file
+        })
         # Assign STATIONS_checker file which has 132 stations
         rm("STATIONS")
 
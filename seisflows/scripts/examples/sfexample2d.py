@@ -29,15 +29,46 @@ model using 3 events and 1 receiver.
 """
 import os
 import sys
+import errno
 import glob
+import shlex
 import shutil
+import hashlib
 import subprocess
 import numpy as np
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
 from seisflows.tools import msg
-from seisflows.config import Dict
 from seisflows.seisflows import SeisFlows
-from seisflows.tools.unix import cd, cp, rm, ln, mv, mkdir
+from seisflows.tools.specfem import getpar, setpars
+from seisflows.tools.unix import cd, rm, ln, mv, mkdir
+
+
+@dataclass(frozen=True)
+class SPECFEM2DPaths:
+    """
+    Required structures from the SPECFEM2D repository
+    """
+    repo: str
+    bin: str
+    data: str
+    example: str
+    example_data: str
+
+
+@dataclass(frozen=True)
+class WorkdirPaths:
+    """
+    The SPECFEM2D working directory structure created by the example
+    """
+    workdir: str
+    bin: str
+    data: str
+    output: str
+    model_init: str
+    model_true: str
+    workdir_init: str
 
 
 class SFExample2D:
@@ -45,7 +76,7 @@ class SFExample2D:
     A class for running SeisFlows examples. Simplifies calls structure so that
     multiple example runs can benefit from the code written here
     """
-    def __init__(self, ntask=3, niter=2):
+    def __init__(self, ntask=3, niter=2, mpiexec="mpirun"):
         """
         Set path structure which is used to navigate around SPECFEM repositories
         and the example working directory
@@ -55,6 +86,10 @@ class SFExample2D:
             defaults to 3
         :type niter: int
         :param niter: number of iterations to run. defaults to 2
+        :type mpiexec: str
+        :param mpiexec: MPI executable used to run the SPECFEM2D binaries when
+            the Par_file sets NPROC > 1. Requires SPECFEM2D to be compiled
+            with MPI. defaults to 'mpirun'
         """
         specfem2d_repo = input(
             msg.cli("If you have already downloaded SPECMFE2D, please input "
@@ -73,6 +108,7 @@ class SFExample2D:
         self.niter = niter
         assert(1 <= self.niter <= np.inf), \
             f"number of iterations must be between 1 and inf, not {self.niter}"
+        self.mpiexec = mpiexec
 
         # This bool information is provided by the User running 'setup' or 'run'
         self.run_example = bool(sys.argv[1] == "run")
@@ -94,6 +130,9 @@ class SFExample2D:
         :param specfem2d_repo: location of the SPECFEM2D repository
         :type ex: str
         :type ex: The name of the example problem inside SPECFEM2D/EXAMPLES
+        :rtype: tuple (SPECFEM2DPaths, WorkdirPaths)
+        :return: paths in the SPECFEM2D repository, and paths in the working
+            directory
         """
         if not specfem2d_repo:
             print(f"No existing SPECFEM2D repo given, default to: "
@@ -106,36 +145,53 @@ class SFExample2D:
             )
 
         # This defines required structures from the SPECFEM2D repository
-        sem2d = {
-            "repo": specfem2d_repo,
-            "bin": os.path.join(specfem2d_repo, "bin"),
-            "data": os.path.join(specfem2d_repo, "DATA"),
-            "example": os.path.join(specfem2d_repo, "EXAMPLES", ex),
-            "example_data": os.path.join(specfem2d_repo, "EXAMPLES", ex, "DATA")
-        }
+        example = os.path.join(specfem2d_repo, "EXAMPLES", ex)
+        sem2d = SPECFEM2DPaths(
+            repo=specfem2d_repo,
+            bin=os.path.join(specfem2d_repo, "bin"),
+            data=os.path.join(specfem2d_repo, "DATA"),
+            example=example,
+            example_data=os.path.join(example, "DATA"),
+        )
         # This defines a working directory structure which we will create
         working_directory = os.path.join(cwd, "specfem2d_workdir")
-        workdir = {
-            "workdir": os.path.join(working_directory),
-            "bin": os.path.join(working_directory, "bin"),
-            "data": os.path.join(working_directory, "DATA"),
-            "output": os.path.join(working_directory, "OUTPUT_FILES"),
-            "model_init": os.path.join(working_directory, "OUTPUT_FILES_INIT"),
-            "model_true": os.path.join(working_directory, "OUTPUT_FILES_TRUE"),
-        }
-        return Dict(sem2d), Dict(workdir)
+        workdir = WorkdirPaths(
+            workdir=working_directory,
+            bin=os.path.join(working_directory, "bin"),
+            data=os.path.join(working_directory, "DATA"),
+            output=os.path.join(working_directory, "OUTPUT_FILES"),
+            model_init=os.path.join(working_directory, "OUTPUT_FILES_INIT"),
+            model_true=os.path.join(working_directory, "OUTPUT_FILES_TRUE"),
+            # Sibling copy of the working directory used to generate MODEL_INIT
+            # at the same time as MODEL_TRUE is generated in `workdir`
+            workdir_init=os.path.join(cwd, "specfem2d_workdir_init"),
+        )
+        return sem2d, workdir
 
     def download_specfem2d(self):
         """
         Download the latest version of SPECFEM2D from GitHub, devel branch.
         Last successfully tested 4/28/22
+
+        .. note::
+            Only the working tree is required to compile SPECFEM2D, so by
+            default a shallow clone (depth 1) is made. The depth can be changed
+            with the environment variable SPECFEM2D_GIT_DEPTH, where a value
+            of 0 clones the full history
         """
         if not os.path.exists(self.sem2d_paths.repo):
-            cmd = ("git clone --recursive --branch devel " 
-                   "https://github.com/geodynamics/specfem2d.git")
+            depth = int(os.environ.get("SPECFEM2D_GIT_DEPTH", 1))
+            if depth > 0:
+                shallow = [f"--depth={depth}", "--shallow-submodules",
+                           "--single-branch"]
+            else:
+                shallow = []
+            cmd = (["git", "clone", "--recursive"] + shallow +
+                   ["--branch", "devel",
+                    "https://github.com/geodynamics/specfem2d.git"])
 
-            print(f"Downloading SPECFEM2D with command: {cmd}")
-            subprocess.run(cmd, shell=True, check=True)
+            print(f"Downloading SPECFEM2D with command: {' '.join(cmd)}")
+            subprocess.run(cmd, check=True)
 
     def configure_specfem2d_and_make_binaries(self):
         """
@@ -143,15 +199,30 @@ class SFExample2D:
         This function assumes it is being run from inside the repo. Should guess
         all the configuration options. Probably the least stable part of the
         example
+
+        .. note::
+            Compiled binaries are cached in ~/.cache/seisflows/specfem2d/,
+            keyed by the SPECFEM2D commit, Fortran compiler version and
+            configure command line (e.g., serial and MPI builds are cached
+            separately), so that recreating the SPECFEM2D repository does not
+            require recompiling. Remove the cache directory to force a rebuild
         """
         cd(self.sem2d_paths.repo)
+        cache_bin = self._get_specfem2d_cache_bin()
+        if cache_bin and glob.glob(os.path.join(cache_bin, "x*")) and \
+                not glob.glob("./bin/x*"):
+            print(f"Restoring cached SPECFEM2D binaries from: {cache_bin}")
+            self._copy_tree(cache_bin, self.sem2d_paths.bin, link=True)
+
         try:
-            if not os.path.exists("./config.log"):
-                cmd = "./configure"
-                print(f"Configuring SPECFEM2D with command: {cmd}")
+            if glob.glob("./bin/x*"):
+                print("executables found in SPECFEM2D/bin directory, "
+                      "skipping 'configure'")
+            elif not os.path.exists("./config.log"):
+                cmd = ["./configure"]
+                print(f"Configuring SPECFEM2D with command: {' '.join(cmd)}")
                 # Ignore the configure outputs from SPECFEM
-                subprocess.run(cmd, shell=True, check=True,
-                               stdout=subprocess.DEVNULL)
+                subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL)
             else:
                 print("SPECFEM2D already configured, skipping 'configure'")
         except subprocess.CalledProcessError as e:
@@ -162,11 +233,18 @@ class SFExample2D:
 
         try:
             if not glob.glob("./bin/x*"):
-                cmd = "make all"
-                print(f"Making SPECFEM2D binaries with command: {cmd}")
+                # Compile in parallel using all cores available to this process
+                try:
+                    nproc = len(os.sched_getaffinity(0))
+                except AttributeError:  # not available on e.g., Mac OS
+                    nproc = os.cpu_count() or 1
+                cmd = ["make", f"-j{nproc}", "all"]
+                print(f"Making SPECFEM2D binaries with command: "
+                      f"{' '.join(cmd)}")
                 # Ignore the make outputs from SPECFEM
-                subprocess.run(cmd, shell=True, check=True,
-                               stdout=subprocess.DEVNULL)
+                subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL)
+                if cache_bin and not os.path.exists(cache_bin):
+                    self._cache_specfem2d_bin(self.sem2d_paths.bin, cache_bin)
             else:
                 print("executables found in SPECFEM2D/bin directory, "
                       "skipping 'make'")
@@ -182,13 +260,88 @@ class SFExample2D:
             print("symlinking existing specfem2D repository to cwd")
             ln(self.sem2d_paths.repo, os.path.join(self.cwd, "specfem2d"))
 
+    def _get_specfem2d_cache_bin(self):
+        """
+        Determine the build cache directory for the SPECFEM2D binaries, keyed
+        by the repository's commit SHA, the version of the Fortran compiler and
+        the configure command line. The command line is read from config.log
+        if SPECFEM2D has already been configured, otherwise it is the plain
+        './configure' run by this example. Repositories which are not git
+        repositories, or which contain local modifications, are not cached
+
+        :rtype: str or None
+        :return: path to the cached bin/ directory, or None if the binaries
+            should not be cached
+        """
+        repo = self.sem2d_paths.repo
+        try:
+            sha = subprocess.run(["git", "-C", repo, "rev-parse", "HEAD"],
+                                 check=True, capture_output=True,
+                                 text=True).stdout.strip()
+            modified = subprocess.run(
+                ["git", "-C", repo, "status", "--porcelain",
+                 "--untracked-files=no"], check=True, capture_output=True,
+                text=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        if modified:
+            return None
+
+        try:
+            fc_version = subprocess.run(
+                [os.environ.get("FC", "gfortran"), "--version"],
+                capture_output=True, text=True).stdout
+        except OSError:
+            fc_version = ""
+
+        # Autoconf records the invocation as '  $ ./configure [options]'
+        configure_cmd = "./configure"
+        try:
+            with open(os.path.join(repo, "config.log")) as f:
+                for line in f:
+                    if line.lstrip().startswith("$ "):
+                        configure_cmd = line.strip()[2:]
+                        break
+        except FileNotFoundError:
+            pass
+
+        build = f"{fc_version}\n{configure_cmd}"
+        build_hash = hashlib.sha1(build.encode()).hexdigest()[:8]
+
+        cache = os.environ.get("XDG_CACHE_HOME",
+                               os.path.join(os.path.expanduser("~"), ".cache"))
+        return os.path.join(cache, "seisflows", "specfem2d",
+                            f"{sha}_{build_hash}", "bin")
+
+    @staticmethod
+    def _cache_specfem2d_bin(src, cache_bin):
+        """
+        Copy freshly compiled binaries into the build cache. Copies to a
+        temporary directory first so that concurrent or interrupted example
+        runs never leave a partially populated cache behind
+
+        :type src: str
+        :param src: SPECFEM2D bin/ directory containing compiled binaries
+        :type cache_bin: str
+        :param cache_bin: cache directory to populate, must not exist
+        """
+        tmp = f"{cache_bin}.tmp{os.getpid()}"
+        try:
+            shutil.copytree(src, tmp)
+            os.rename(tmp, cache_bin)
+            print(f"Cached SPECFEM2D binaries to: {cache_bin}")
+        except OSError as e:
+            print(f"Could not cache SPECFEM2D binaries, skipping: {e}")
+        finally:
+            rm(tmp)
+
     def create_specfem2d_working_directory(self):
         """
         Create the working directory where we will generate our initial and
         final models using one of the SPECFEM2D examples
         """
-        assert(os.path.exists(self.sem2d_paths["example"])), (
-            f"SPECFEM2D/EXAMPLE directory: '{self.sem2d['example']}' "
+        assert(os.path.exists(self.sem2d_paths.example)), (
+            f"SPECFEM2D/EXAMPLE directory: '{self.sem2d_paths.example}' "
             f"does not exist, please check this path and try again."
         )
 
@@ -196,9 +349,12 @@ class SFExample2D:
         rm(self.workdir_paths.workdir)
         mkdir(self.workdir_paths.workdir)
 
-        # Copy the binary executables and DATA from the SPECFEM2D example
-        cp(self.sem2d_paths.bin, self.workdir_paths.bin)
-        cp(self.sem2d_paths.example_data, self.workdir_paths.data)
+        # Hardlink the binary executables, which are never modified, and clone
+        # DATA from the SPECFEM2D example, which will be edited in place
+        self._copy_tree(self.sem2d_paths.bin, self.workdir_paths.bin,
+                        link=True)
+        self._clone_tree(self.sem2d_paths.example_data,
+                         self.workdir_paths.data)
 
         # Make sure that SPECFEM2D can find the expected files in the DATA/ dir
         cd(self.workdir_paths.data)
@@ -207,6 +363,65 @@ class SFExample2D:
         rm("Par_file")
         ln("Par_file_Tape2007_onerec", "Par_file")
 
+    @staticmethod
+    def _copy_tree(src, dst, link=False):
+        """
+        Copy the directory tree `src` to `dst`, following symlinks like `cp`.
+        Directories are created up front, then files are copied concurrently
+        by a pool of threads, as copying many files is I/O bound
+
+        :type src: str
+        :param src: source directory
+        :type dst: str
+        :param dst: destination directory, created if it does not exist
+        :type link: bool
+        :param link: hardlink files rather than copying them so that no file
+            contents are copied. Files which cannot be linked, e.g., if `src`
+            and `dst` are on different devices, are copied instead. Only
+            suitable for files which will not be edited in place
+        """
+        def _copy(paths):
+            src_file, dst_file = paths
+            if link:
+                try:
+                    os.link(src_file, dst_file)
+                    return
+                except OSError:
+                    pass
+            shutil.copy2(src_file, dst_file)
+
+        paths = []
+        for root, _, files in os.walk(src, followlinks=True):
+            dst_root = os.path.join(dst, os.path.relpath(root, src))
+            os.makedirs(dst_root, exist_ok=True)
+            for fid in files:
+                paths.append((os.path.join(root, fid),
+                              os.path.join(dst_root, fid)))
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            # Wrapped in a list so that any errors are raised here
+            list(executor.map(_copy, paths))
+
+    def _clone_tree(self, src, dst):
+        """
+        Copy the directory tree `src` to `dst`, using copy-on-write reflinks
+        where the filesystem supports them (e.g., btrfs, xfs) so that file
+        blocks are shared with the source until they are modified. Falls back
+        to a regular copy if GNU `cp` is not available (e.g., Mac OS). As with
+        `cp`, symlinks are followed
+
+        :type src: str
+        :param src: source directory
+        :type dst: str
+        :param dst: destination directory, must not exist
+        """
+        try:
+            subprocess.run(["cp", "-a", "-L", "--reflink=auto", src, dst],
+                           check=True, stderr=subprocess.DEVNULL)
+        except (OSError, subprocess.CalledProcessError):
+            rm(dst)
+            self._copy_tree(src, dst)
+
     def setup_specfem2d_for_model_init(self):
         """
         Make some adjustments to the original parameter file to.
@@ -218,9 +433,11 @@ class SFExample2D:
 
         print("> Setting the SPECFEM2D Par_file for SeisFlows compatiblility")
 
-        self.sf.sempar("setup_with_binary_database", 1)  # create .bin files
-        self.sf.sempar("save_model", "binary")  # output model in .bin format
-        self.sf.sempar("save_ASCII_kernels", ".false.")  # kernels also .bin
+        self.sempar_bulk({
+            "setup_with_binary_database": 1,  # create .bin files
+            "save_model": "binary",  # output model in .bin format
+            "save_ASCII_kernels": ".false.",  # kernels also .bin
+        })
 
         rm(self.workdir_paths.output)
         mkdir(self.workdir_paths.output)
@@ -238,23 +455,87 @@ class SFExample2D:
         new_model = "1 1 2600.d0 5900.d0 3550.0d0 0 0 10.d0 10.d0 0 0 0 0 0 0"
         self.sf.sempar("velocity_model", new_model)
 
-    def run_xspecfem2d_binaries(self):
+    def create_specfem2d_model_init_directory(self):
         """
-        Runs the xmeshfem2d and then xspecfem2d binaries using subprocess and then
-        do some cleanup to get files in the correct locations. Assumes that we
-        can run the binaries directly with './'
+        Copy the working directory, as set up for MODEL_INIT, to a sibling
+        directory so that MODEL_INIT can be generated concurrently with
+        MODEL_TRUE, which will be set up in the original working directory
         """
-        cd(self.workdir_paths.workdir)
+        workdir_init = self.workdir_paths.workdir_init
+        rm(workdir_init)
+        mkdir(workdir_init)
+
+        # As with the original working directory, hardlink binaries and clone
+        # DATA/, which resolves the SOURCE and Par_file symlinks
+        self._copy_tree(self.workdir_paths.bin,
+                        os.path.join(workdir_init, "bin"), link=True)
+        self._clone_tree(self.workdir_paths.data,
+                         os.path.join(workdir_init, "DATA"))
+        mkdir(os.path.join(workdir_init, "OUTPUT_FILES"))
+
+    def run_xspecfem2d_binaries(self, workdirs=None):
+        """
+        Runs the xmeshfem2d and then xspecfem2d binaries using subprocess.
+        Binaries are run directly with './' unless the Par_file sets NPROC > 1,
+        in which case they are run with `mpiexec`. Multiple working directories
+        are run concurrently, as far as the number of available cores allows
+
+        :type workdirs: list of str
+        :param workdirs: SPECFEM2D working directories, each containing their
+            own bin/, DATA/ and OUTPUT_FILES/ directories. Defaults to the
+            example working directory
+        """
+        workdirs = workdirs or [self.workdir_paths.workdir]
 
-        cmd_mesh = f"./bin/xmeshfem2D > OUTPUT_FILES/mesher.log.txt"
-        cmd_spec = f"./bin/xspecfem2D > OUTPUT_FILES/solver.log.txt"
+        nproc = max(self._get_nproc(workdir) for workdir in workdirs)
+        max_workers = max(1, min(len(workdirs), (os.cpu_count() or 1) // nproc))
 
-        for cmd in [cmd_mesh, cmd_spec]:
-            print(f"Running SPECFEM2D with command: {cmd}")
-            subprocess.run(cmd, shell=True, check=True,
-                           stdout=subprocess.DEVNULL)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Wrapped in a list so that any errors are raised here
+            list(executor.map(self._run_xspecfem2d, workdirs))
+
+    def _run_xspecfem2d(self, workdir):
+        """
+        Run the mesher and solver one after the other in a single SPECFEM2D
+        working directory. Does not change the current working directory so
+        that multiple working directories can be run at the same time
+
+        :type workdir: str
+        :param workdir: SPECFEM2D working directory to run binaries in
+        """
+        nproc = self._get_nproc(workdir)
+        if nproc > 1:
+            exc = shlex.split(self.mpiexec) + ["-n", str(nproc)]
+        else:
+            exc = []
+
+        for binary, log in [("xmeshfem2D", "mesher.log.txt"),
+                            ("xspecfem2D", "solver.log.txt")]:
+            cmd = exc + [f"./bin/{binary}"]
+            log = os.path.join("OUTPUT_FILES", log)
+            print(f"Running SPECFEM2D in {workdir} with command: "
+                  f"{' '.join(cmd)} > {log}")
+            with open(os.path.join(workdir, log), "wb") as f:
+                subprocess.run(cmd, check=True, cwd=workdir, stdout=f)
+
+    @staticmethod
+    def _get_nproc(workdir):
+        """
+        Get the number of processors a SPECFEM2D run requires from its Par_file
 
-    def cleanup_xspecfem2d_run(self, choice=None):
+        :type workdir: str
+        :param workdir: SPECFEM2D working directory containing DATA/Par_file
+        :rtype: int
+        :return: value of NPROC, defaults to 1 if not found
+        """
+        try:
+            _, nproc, _ = getpar("NPROC",
+                                 file=os.path.join(workdir, "DATA", "Par_file"))
+        except KeyError:
+            return 1
+        return int(nproc or 1)
+
+    def cleanup_xspecfem2d_run(self, choice=None, workdir=None):
         """
         Do some cleanup after running the SPECFEM2D binaries to make sure files
         are in the correct locations, and rename the OUTPUT_FILES directory so
@@ -263,22 +544,39 @@ class SFExample2D:
         :type choice: str
         :param choice: Rename the OUTPUT_FILES directory with a suffix tag
             msut be 'INIT' or 'TRUE'. If None, will not rename but the
+        :type workdir: str
+        :param workdir: SPECFEM2D working directory that was run. Defaults to
+            the example working directory
         """
-        cd(self.workdir_paths.workdir)
+        workdir = workdir or self.workdir_paths.workdir
+        output = os.path.join(workdir, "OUTPUT_FILES")
+
+        cd(workdir)
         print("> Cleaning up after xspecfem2d, setting up for new run")
 
         # SPECFEM2D outputs its models in the DATA/ directory by default,
         # while SeisFlows expects this in the OUTPUT_FILES/ directory (which is
         # the default in SPECFEM3D)
-        mv(glob.glob("DATA/*bin"), self.workdir_paths.output)
+        with os.scandir(os.path.join(workdir, "DATA")) as entries:
+            for entry in entries:
+                if not entry.name.endswith("bin"):
+                    continue
+                dst = os.path.join(output, entry.name)
+                try:
+                    os.rename(entry.path, dst)
+                except OSError as e:
+                    # os.rename cannot move files across filesystems
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.move(entry.path, dst)
 
         if choice == "INIT":
-            mv(self.workdir_paths.output, self.workdir_paths.model_init)
+            mv(output, self.workdir_paths.model_init)
             # Create a new OUTPUT_FILES/ directory for TRUE run
-            rm(self.workdir_paths.output)
-            mkdir(self.workdir_paths.output)
+            rm(output)
+            mkdir(output)
         elif choice == "TRUE":
-            mv(self.workdir_paths.output, self.workdir_paths.model_true)
+            mv(output, self.workdir_paths.model_true)
 
     def setup_seisflows_working_directory(self):
         """
@@ -290,22 +588,66 @@ class SFExample2D:
         self.sf.setup(force=True)  # Force will delete existing parameter file
         self.sf.configure()
 
-        self.sf.par("ntask", self.ntask)  # default 3 sources for this example
-        self.sf.par("materials", "elastic")  # how velocity model parameterized
-        self.sf.par("density", "constant")  # update density or keep constant
-        self.sf.par("nt", 5000)  # set by SPECFEM2D Par_file
-        self.sf.par("dt", .06)  # set by SPECFEM2D Par_file
-        self.sf.par("f0", 0.084)  # set by SOURCE file
-        self.sf.par("format", "ascii")  # how to output synthetic seismograms
-        self.sf.par("begin", 1)  # first iteration
-        self.sf.par("end", self.niter)  # final iteration -- we will run 2
-        self.sf.par("case", "synthetic")  # synthetic-synthetic inversion
-        self.sf.par("attenuation", False)
-
-        self.sf.par("specfem_bin", self.workdir_paths.bin)
-        self.sf.par("specfem_data", self.workdir_paths.data)
-        self.sf.par("model_init", self.workdir_paths.model_init)
-        self.sf.par("model_true", self.workdir_paths.model_true)
+        self.par_bulk({
+            "ntask": self.ntask,  # default 3 sources for this example
+            "materials": "elastic",  # how velocity model parameterized
+            "density": "constant",  # update density or keep constant
+            "nt": 5000,  # set by SPECFEM2D Par_file
+            "dt": .06,  # set by SPECFEM2D Par_file
+            "f0": 0.084,  # set by SOURCE file
+            "format": "ascii",  # how to output synthetic seismograms
+            "begin": 1,  # first iteration
+            "end": self.niter,  # final iteration -- we will run 2
+            "case": "synthetic",  # synthetic-synthetic inversion
+            "attenuation": False,
+
+            "specfem_bin": self.workdir_paths.bin,
+            "specfem_data": self.workdir_paths.data,
+            "model_init": self.workdir_paths.model_init,
+            "model_true": self.workdir_paths.model_true,
+        })
+
+    def par_bulk(self, pars):
+        """
+        Set multiple parameters in the SeisFlows parameter file, equivalent to
+        repeated calls of `seisflows par` but reading and writing the
+        parameter file only once
+
+        :type pars: dict
+        :param pars: parameter names and the values to set for them
+        """
+        self._setpars(pars, par_file=self.sf._args.parameter_file, delim=":")
+
+    def sempar_bulk(self, pars, par_file="Par_file"):
+        """
+        Set multiple parameters in a SPECFEM parameter file, equivalent to
+        repeated calls of `seisflows sempar` but reading and writing the
+        parameter file only once. Does not handle 'velocity_model', which
+        should be set with `seisflows sempar`
+
+        :type pars: dict
+        :param pars: parameter names and the values to set for them
+        :type par_file: str
+        :param par_file: name of the SPECFEM parameter file, defaults: Par_file
+        """
+        self._setpars(pars, par_file=par_file, delim="=")
+
+    @staticmethod
+    def _setpars(pars, par_file, delim):
+        """
+        Set multiple parameters in a parameter file with a single rewrite,
+        printing each change in the same way as `seisflows par` and `sempar`
+
+        :type pars: dict
+        :param pars: parameter names and the values to set for them
+        :type par_file: str
+        :param par_file: path to the parameter file
+        :type delim: str
+        :param delim: delimiter between parameters and values within the file
+        """
+        cur_vals = setpars(pars, file=par_file, delim=delim)
+        for key, val in pars.items():
+            print(msg.cli(f"{key}: {cur_vals[key]} -> {val}"))
 
     def finalize_specfem2d_par_file(self):
         """
@@ -321,7 +663,7 @@ class SFExample2D:
         Use subprocess to run the SeisFlows example we just set up
         """
         cd(self.cwd)
-        subprocess.run("seisflows submit -f", check=False, shell=True)
+        subprocess.run(["seisflows", "submit", "-f"], check=False)
 
     def main(self):
         """
@@ -333,16 +675,19 @@ class SFExample2D:
         self.configure_specfem2d_and_make_binaries()
         # Step 2: Create a working directory and generate initial/final models
         self.create_specfem2d_working_directory()
-        # Step 2a: Generate MODEL_INIT, rearrange consequent directory structure
-        print(msg.cli("GENERATING INITIAL MODEL", border="="))
+        # Step 2a: Set up MODEL_INIT in a separate copy of the working directory
         self.setup_specfem2d_for_model_init()
-        self.run_xspecfem2d_binaries()
-        self.cleanup_xspecfem2d_run(choice="INIT")
-        # Step 2b: Generate MODEL_INIT, rearrange consequent directory structure
-        print(msg.cli("GENERATING TRUE/TARGET MODEL", border="="))
+        self.create_specfem2d_model_init_directory()
+        # Step 2b: Set up MODEL_TRUE in the original working directory
         self.setup_specfem2d_for_model_true()
-        self.run_xspecfem2d_binaries()
+        # Step 2c: Generate both models at once, rearrange directory structure
+        print(msg.cli("GENERATING INITIAL AND TRUE/TARGET MODELS", border="="))
+        self.run_xspecfem2d_binaries(workdirs=[self.workdir_paths.workdir_init,
+                                               self.workdir_paths.workdir])
+        self.cleanup_xspecfem2d_run(choice="INIT",
+                                    workdir=self.workdir_paths.workdir_init)
         self.cleanup_xspecfem2d_run(choice="TRUE")
+        rm(self.workdir_paths.workdir_init)
         # Step 3: Prepare Par_file and directory for MODEL_TRUE generation
         self.setup_seisflows_working_directory()
         self.finalize_specfem2d_par_file()
@@ -1328,6 +1328,11 @@ class SeisFlows:
         # optimize.finalize_search()
         optimize.line_search.step_count = 0
 
+        # Misfits cached during the failed search must be re-evaluated, e.g.,
+        # if simulations failed or data/preprocessing have since been changed
+        if hasattr(workflow, "clear_misfit_cache"):
+            workflow.clear_misfit_cache()
+
         print(msg.cli(f"resetting line search machinery. step count: "
                       f"{current_step} -> {optimize.line_search.step_count }"))
         workflow.checkpoint()
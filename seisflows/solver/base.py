@@ -499,7 +499,7 @@ class Base:
             for iproc in range(nproc):
                 imin = sum(ngll) * idim + sum(ngll[:iproc])
                 imax = sum(ngll) * idim + sum(ngll[:iproc + 1])
-                model[key] += [m[imin:imax]]
+                model[key].append(m[imin:imax])
 
         return model
 
@@ -848,7 +848,7 @@ class Base:
         while True:
             dummy = self.io.read_slice(path=path, parameters=key, 
                                        iproc=iproc)[0]
-            ngll += [len(dummy)]
+            ngll.append(len(dummy))
             iproc += 1
             if not exists(os.path.join(path,
                                        f"proc{int(iproc):06d}_{key}.bin")):
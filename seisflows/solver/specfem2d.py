@@ -367,7 +367,9 @@ class Specfem2D(custom_import("solver", "base")):
             filenames = []
             if PAR.FORMAT.upper() == "SU":
                 for comp in PAR.COMPONENTS:
-                    filenames += [self.data_wildcard.format(comp=comp.lower())]
+                    filenames.append(
+                        self.data_wildcard.format(comp=comp.lower())
+                    )
                     # filenames += [f"U{comp.lower()}_file_single.su"]
             elif PAR.FORMAT.upper() == "ASCII":
                 for comp in PAR.COMPONENTS:
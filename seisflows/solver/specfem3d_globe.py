@@ -83,7 +83,7 @@ class Specfem3DGlobe(custom_import("solver", "specfem3d")):
             keys, vals = loadbypar(path, self.parameters, iproc, prefix,
                                    suffix)
             for key, val in zip(keys, vals):
-                model[key] += [val]
+                model[key].append(val)
 
             minmax.update(keys, vals)
 
@@ -142,7 +142,7 @@ class Specfem3DGlobe(custom_import("solver", "specfem3d")):
             ngll = []
             while True:
                 dummy = loadbin(path, nproc, 'reg1_' + parameters[0])
-                ngll += [len(dummy)]
+                ngll.append(len(dummy))
                 nproc += 1
                 if not exists(
                         os.path.join(path,
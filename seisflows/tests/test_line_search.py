@@ -0,0 +1,173 @@
+"""
+Test suite for the SeisFlows line search plugins, which keep the line search
+history used by the optimization module to determine trial step lengths
+"""
+import os
+import numpy as np
+
+from seisflows.plugins.line_search import Bracket
+from seisflows.plugins.line_search.base import Base
+
+
+class ScriptedSearch(Base):
+    """
+    Line search whose step lengths and statuses are set by the test, so that
+    only the history and logging of the Base class are being tested
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.status = 0
+
+    def calculate_step(self):
+        return 1., self.status
+
+
+def run_bracket_searches(line_search, nsearch=4):
+    """
+    Run a number of bracketing line searches in the same way as the
+    optimization module, i.e., initialize, then update with trial misfits,
+    incrementing the step count after each trial
+
+    :rtype: list
+    :return: alpha, status and search history after each update
+    """
+    results = []
+    for it in range(1, nsearch + 1):
+        alpha, status = line_search.initialize(iter=it, step_len=0.,
+                                               func_val=10. / it,
+                                               gtg=2. * it, gtp=-1. * it)
+        for func_val in [8. / it, 9. / it]:
+            line_search.step_count += 1
+            alpha, status = line_search.update(iter=it, step_len=alpha,
+                                               func_val=func_val)
+            history = [np.array(_, dtype=float)
+                       for _ in line_search.search_history()]
+            results.append((alpha, status, history))
+        line_search.step_count = 0
+    return results
+
+
+def test_history_grows_past_max_history(tmpdir):
+    """
+    Test that preallocated history and dot product arrays are grown when
+    exceeded, without changing the result of the line search
+    """
+    small = Bracket(step_count_max=10, step_len_max=None,
+                    log_file=os.path.join(tmpdir, "small.txt"), max_history=1,
+                    max_searches=1)
+    large = Bracket(step_count_max=10, step_len_max=None,
+                    log_file=os.path.join(tmpdir, "large.txt"))
+
+    for (alpha_s, status_s, hist_s), (alpha_l, status_l, hist_l) in zip(
+            run_bracket_searches(small), run_bracket_searches(large)):
+        assert(alpha_s == alpha_l)
+        assert(status_s == status_l)
+        for arr_s, arr_l in zip(hist_s, hist_l):
+            np.testing.assert_array_equal(arr_s, arr_l)
+
+    # 4 searches with an initial step and 2 trial steps each
+    assert(len(small.step_lens) == len(small.func_vals) == 12)
+    assert(len(small.gtg) == len(small.gtp) == 4)
+    assert(np.count_nonzero(small.step_lens == 0) == 4)
+    np.testing.assert_array_equal(small.gtg, [2., 4., 6., 8.])
+
+    with open(os.path.join(tmpdir, "small.txt")) as f:
+        small_log = f.read()
+    with open(os.path.join(tmpdir, "large.txt")) as f:
+        assert(small_log == f.read())
+
+
+def test_reset_with_zero_steps(tmpdir):
+    """
+    Test that resetting a failed search removes only that search from the
+    history, including its zero step length
+    """
+    ls = ScriptedSearch(step_count_max=10, step_len_max=None,
+                        log_file=os.path.join(tmpdir, "log.txt"),
+                        max_history=2)
+    for it in [1, 2]:
+        ls.initialize(iter=it, step_len=0., func_val=10., gtg=it, gtp=-it)
+        ls.step_count += 1
+        ls.update(iter=it, step_len=1., func_val=9.)
+        ls.step_count = 0
+
+    # Start a third search which fails after two trial steps
+    ls.initialize(iter=3, step_len=0., func_val=9., gtg=3., gtp=-3.)
+    for _ in range(2):
+        ls.step_count += 1
+        ls.update(iter=3, step_len=1., func_val=9.5)
+    assert(ls.search_history()[5] == 2)
+
+    ls.reset()
+    np.testing.assert_array_equal(ls.step_lens, [0., 1., 0., 1.])
+    np.testing.assert_array_equal(ls.gtg, [1., 2.])
+    assert(ls.search_history()[5] == 1)
+
+    # Restarting the search counts its zero step length again
+    ls.step_count = 0
+    ls.initialize(iter=3, step_len=0., func_val=9., gtg=3., gtp=-3.)
+    x, f, gtg, gtp, i, j = ls.search_history()
+    np.testing.assert_array_equal(x, [0.])
+    np.testing.assert_array_equal(gtg, [1., 2., 3.])
+    assert(i == 0)
+    assert(j == 2)
+
+
+def test_reset_first_step_clears_history(tmpdir):
+    """
+    Test that resetting during the very first search clears the history
+    """
+    ls = ScriptedSearch(step_count_max=10, step_len_max=None,
+                        log_file=os.path.join(tmpdir, "log.txt"))
+    ls.initialize(iter=1, step_len=0., func_val=10., gtg=1., gtp=-1.)
+    ls.reset()
+
+    assert(len(ls.step_lens) == 0)
+    assert(len(ls.gtg) == 0)
+    assert(ls.search_history()[5] == -1)
+
+
+def test_flush_log_on_nonzero_status(tmpdir):
+    """
+    Test that line search history is only written to the log file once the
+    line search has passed or failed
+    """
+    log_file = os.path.join(tmpdir, "log.txt")
+    ls = ScriptedSearch(step_count_max=10, step_len_max=None,
+                        log_file=log_file)
+    with open(log_file) as f:
+        header = f.read()
+    assert(header == Base._log_header)
+
+    ls.initialize(iter=1, step_len=0., func_val=10., gtg=1., gtp=-1.)
+    ls.step_count += 1
+    ls.update(iter=1, step_len=1., func_val=9.)
+    with open(log_file) as f:
+        assert(f.read() == header)
+
+    ls.status = 1
+    ls.step_count += 1
+    ls.update(iter=1, step_len=.5, func_val=8.)
+    with open(log_file) as f:
+        lines = f.read()[len(header):].splitlines()
+    assert(lines == [Base._log_line.format(1, 0., 10.).rstrip("\n"),
+                     Base._log_line.format("", 1., 9.).rstrip("\n"),
+                     Base._log_line.format("", .5, 8.).rstrip("\n")])
+
+    # Nothing left to write, further flushes do not duplicate lines
+    ls.flush_log()
+    with open(log_file) as f:
+        assert(len(f.read()[len(header):].splitlines()) == 3)
+
+
+def test_no_log_file(tmpdir):
+    """
+    Test that no log file is written when `log_file` is None
+    """
+    os.chdir(tmpdir)
+    ls = Bracket(step_count_max=10, step_len_max=None, log_file=None)
+    results = run_bracket_searches(ls, nsearch=2)
+    ls.flush_log()
+
+    assert(len(results) == 4)
+    assert(not os.listdir(tmpdir))
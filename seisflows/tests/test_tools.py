@@ -0,0 +1,131 @@
+"""
+Test suite for the SeisFlows tools, general utilities used throughout the
+package
+"""
+import os
+import shutil
+import pytest
+import warnings
+import numpy as np
+from seisflows import config
+from seisflows.tools.math import polynomial_fit
+from seisflows.tools.specfem import getpar, setpar, setpars
+
+
+TEST_DIR = os.path.join(config.ROOT_DIR, "tests")
+
+
+@pytest.fixture
+def par_files(tmpdir):
+    """
+    Make two copies of a SPECFEM2D parameter file in the temporary directory
+
+    :rtype: tuple of str
+    :return: locations of the two parameter files
+    """
+    src = os.path.join(TEST_DIR, "test_data", "DATA",
+                       "Par_file_SPECFEM2D_cf893667")
+    dsts = []
+    for name in ["Par_file_a", "Par_file_b"]:
+        dsts.append(os.path.join(tmpdir, name))
+        shutil.copy(src, dsts[-1])
+    return dsts
+
+
+def test_setpars_matches_setpar(par_files):
+    """
+    Test that setting multiple parameters at once gives the same parameter
+    file as setting them one at a time
+    """
+    par_a, par_b = par_files
+    pars = {"title": "setpars test", "SIMULATION_TYPE": 3,
+            "save_forward": ".true.", "NPROC": 4}
+    cur_vals = {key: getpar(key, par_a)[1] for key in pars}
+
+    for key, val in pars.items():
+        setpar(key, val, par_a)
+
+    assert(setpars(pars, par_b) == cur_vals)
+    with open(par_a) as fa, open(par_b) as fb:
+        assert(fa.read() == fb.read())
+    for key, val in pars.items():
+        assert(getpar(key, par_b)[1] == str(val))
+
+
+def test_setpars_empty_value(tmpdir):
+    """
+    Test that parameters without a value have their value appended, for
+    both SPECFEM and SeisFlows style delimiters
+    """
+    for delim in ["=", ":"]:
+        par_a = os.path.join(tmpdir, f"par_a{delim}")
+        par_b = os.path.join(tmpdir, f"par_b{delim}")
+        for fid in [par_a, par_b]:
+            with open(fid, "w") as f:
+                f.write(f"A {delim} 1\nEMPTY {delim}\nB {delim} 2\n")
+
+        setpar("empty", "val", par_a, delim=delim)
+        setpar("b", 3, par_a, delim=delim)
+        assert(setpars({"empty": "val", "b": 3}, par_b, delim=delim) ==
+               {"empty": "", "b": "2"})
+
+        with open(par_a) as fa, open(par_b) as fb:
+            assert(fa.read() == fb.read())
+        assert(getpar("empty", par_b, delim=delim)[1] == "val")
+
+
+def test_setpars_duplicate_keys(par_files):
+    """
+    Test that keys matching the same parameter are applied in order, and that
+    each key returns the value it overwrote
+    """
+    par_a, _ = par_files
+    nproc = getpar("nproc", par_a)[1]
+
+    assert(setpars({"nproc": 4, "NPROC": 8}, par_a) ==
+           {"nproc": nproc, "NPROC": "4"})
+    assert(getpar("nproc", par_a)[1] == "8")
+
+
+def test_setpars_missing_key(par_files):
+    """
+    Test that a missing key raises a KeyError and leaves the file unchanged
+    """
+    par_a, _ = par_files
+    with open(par_a) as f:
+        before = f.read()
+
+    with pytest.raises(KeyError, match="not_a_parameter"):
+        setpars({"nproc": 4, "not_a_parameter": 1}, par_a)
+    with pytest.raises(KeyError, match="not_a_parameter"):
+        setpar("not_a_parameter", 1, par_a)
+
+    with open(par_a) as f:
+        assert(f.read() == before)
+
+
+def test_polynomial_fit_three_points():
+    """
+    Test that the direct parabola solution for a bracketed minimum matches the
+    vertex of a least squares fit
+    """
+    x = np.array([0., .25, .5, 1.])
+    f = np.array([1., .4, .41, .9])
+
+    p = np.polyfit(x[:3], f[:3], 2)
+    assert(polynomial_fit(x, f) == pytest.approx(-p[1] / (2 * p[0])))
+
+
+def test_polynomial_fit_repeated_step_length():
+    """
+    Test that repeated step lengths, which have no direct parabola solution,
+    fall back to the least squares fit rather than returning NaN
+    """
+    x = np.array([0., .5, .5, 1.])
+    f = np.array([1., .4, .39, .9])
+
+    with warnings.catch_warnings():
+        # Least squares fit is poorly conditioned for repeated step lengths
+        warnings.simplefilter("ignore")
+        alpha = polynomial_fit(x, f)
+    assert(np.isfinite(alpha))
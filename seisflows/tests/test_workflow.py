@@ -0,0 +1,105 @@
+"""
+Test suite for the SeisFlows workflow module, which controls the order of
+operations of the other modules
+"""
+import sys
+import importlib
+import numpy as np
+import pytest
+from unittest.mock import patch, MagicMock
+from seisflows.seisflows import SeisFlows
+
+
+@pytest.fixture
+def inversion(tmpdir):
+    """
+    Import the Inversion workflow against mocked SeisFlows modules, where
+    the optimization module serves a fixed trial model, and every forward
+    simulation (system.run) returns the same misfit
+
+    :rtype: tuple
+    :return: the Inversion workflow, and the mocked system and optimize modules
+    """
+    saved = {}
+    optimize = MagicMock(m_try="m_try", f_try="f_try", eval_str="i01s01")
+    optimize.line_search.step_count = 0
+    optimize.load.return_value = np.ones(10)
+    optimize.savetxt.side_effect = lambda tag, val: saved.update({tag: val})
+    optimize.loadtxt.side_effect = lambda tag: saved[tag]
+    optimize.update_search.return_value = 1
+
+    preprocess = MagicMock()
+    preprocess.sum_residuals.return_value = 1.5
+
+    modules = {
+        "seisflows_parameters": MagicMock(NTASK=1),
+        "seisflows_paths": MagicMock(FUNC=str(tmpdir), GRAD=str(tmpdir)),
+        "seisflows_system": MagicMock(),
+        "seisflows_solver": MagicMock(),
+        "seisflows_optimize": optimize,
+        "seisflows_preprocess": preprocess,
+        "seisflows_postprocess": MagicMock(),
+    }
+    with patch.dict(sys.modules, modules):
+        # Re-import so that module-level references point to the mocks
+        for name in ["seisflows.workflow.inversion", "seisflows.workflow.base"]:
+            sys.modules.pop(name, None)
+        module = importlib.import_module("seisflows.workflow.inversion")
+        workflow = module.Inversion()
+        sys.modules["seisflows_workflow"] = workflow
+        yield workflow, modules["seisflows_system"], optimize
+
+
+def test_misfit_cache_within_search(inversion):
+    """
+    Test that a repeated trial model is not re-simulated within one search
+    """
+    workflow, system, optimize = inversion
+    path = sys.modules["seisflows_paths"].FUNC
+
+    workflow.evaluate_function(path=path, suffix="try")
+    workflow.evaluate_function(path=path, suffix="try")
+    assert(system.run.call_count == 1)
+    assert(optimize.loadtxt("f_try") == 1.5)
+
+    # Models for the gradient evaluation are always simulated
+    optimize.m_new, optimize.f_new = "m_try", "f_new"
+    workflow.evaluate_function(path=path, suffix="new")
+    assert(system.run.call_count == 2)
+
+
+def test_misfit_cache_cleared_on_new_search(inversion):
+    """
+    Test that a repeated trial model is re-simulated once a new line search
+    starts, e.g., when resuming from a failed line search
+    """
+    workflow, system, optimize = inversion
+
+    optimize.line_search.step_count = 0
+    workflow.line_search()
+    assert(system.run.call_count == 1)
+
+    # Same trial model is simulated again for a new search
+    optimize.line_search.step_count = 0
+    workflow.line_search()
+    assert(system.run.call_count == 2)
+
+
+def test_misfit_cache_cleared_on_reset(inversion):
+    """
+    Test that resetting the line search from the command line forgets the
+    misfits evaluated during the failed search
+    """
+    workflow, system, optimize = inversion
+    path = sys.modules["seisflows_paths"].FUNC
+
+    workflow.evaluate_function(path=path, suffix="try")
+    optimize.line_search.step_count = 2
+    with patch.object(workflow, "checkpoint"):
+        SeisFlows._reset_line_search(MagicMock())
+
+    optimize.line_search.reset.assert_called_once()
+    assert(optimize.line_search.step_count == 0)
+
+    workflow.evaluate_function(path=path, suffix="try")
+    assert(system.run.call_count == 2)
@@ -2,9 +2,12 @@
 """
 Mathematical tools for Seisflows
 """
+import sys
 import numpy as np
 from scipy.signal import hilbert as analytic
 
+from seisflows.tools import msg
+
 
 def angle(x, y):
     """
@@ -145,7 +148,18 @@ def polynomial_fit(x, f):
     :return: trial step length (alpha)
     """
     i = np.argmin(f)
-    p = np.polyfit(x[i-1:i+2], f[i-1:i+2], 2)
+    x_, f_ = x[i-1:i+2], f[i-1:i+2]
+
+    # A bracketed minimum gives exactly three points, in which case the
+    # parabola is solved for directly rather than through a least squares fit.
+    # Repeated step lengths have no direct solution, leave those to polyfit
+    if len(x_) == 3 and len(np.unique(x_)) == 3:
+        d01 = (f_[1] - f_[0]) / (x_[1] - x_[0])
+        d12 = (f_[2] - f_[1]) / (x_[2] - x_[1])
+        a = (d12 - d01) / (x_[2] - x_[0])
+        p = [a, d01 - a * (x_[0] + x_[1])]
+    else:
+        p = np.polyfit(x_, f_, 2)
 
     if p[0] <= 0:
         # TODO Figure out why this exit condition is here
@@ -158,9 +158,9 @@ def get_receiver_coords(st):
         rx, ry, rz = [], [], []
 
         for tr in st:
-            rx += [tr.stats.su.trace_header.group_coordinate_x]
-            ry += [tr.stats.su.trace_header.group_coordinate_y]
-            rz += [0.]
+            rx.append(tr.stats.su.trace_header.group_coordinate_x)
+            ry.append(tr.stats.su.trace_header.group_coordinate_y)
+            rz.append(0.)
         return rx, ry, rz
     else:
         raise NotImplementedError
@@ -181,9 +181,9 @@ def get_source_coords(st):
     if hasattr(st[0].stats, "su"):
         sx, sy, sz = [], [], []
         for tr in st:
-            sx += [tr.stats.su.trace_header.source_coordinate_x]
-            sy += [tr.stats.su.trace_header.source_coordinate_y]
-            sz += [0.]
+            sx.append(tr.stats.su.trace_header.source_coordinate_x)
+            sy.append(tr.stats.su.trace_header.source_coordinate_y)
+            sz.append(0.)
         return sx, sy, sz
     else:
         raise NotImplementedError
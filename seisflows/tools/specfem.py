@@ -106,7 +106,23 @@ def getpar(key, file, delim="=", match_partial=False):
         IF no matches found, returns (None, None, None)
     """
     lines = open(file, "r").readlines()
+    try:
+        return _getpar(key, lines, delim, match_partial)
+    except KeyError:
+        raise KeyError(f"Could not find matching key '{key}' in file: "
+                       f"{file}") from None
+
+
+def _getpar(key, lines, delim="=", match_partial=False):
+    """
+    Match a parameter in the already-read lines of a parameter file. See
+    `getpar` for parameter descriptions
 
+    :type lines: list of str
+    :param lines: lines of the parameter file
+    :rtype: tuple (str, str, int)
+    :return: a tuple of the key, value and line number (indexed from 0).
+    """
     for i, line in enumerate(lines):
         # Find the first occurence, CASE-INSENSITIVE search, strip whitespace
         # To allow for nested parameters
@@ -141,7 +157,7 @@ def getpar(key, file, delim="=", match_partial=False):
                 pass
             break
     else:
-        raise KeyError(f"Could not find matching key '{key}' in file: {file}")
+        raise KeyError(f"Could not find matching key '{key}'")
     return key_out, val, i
 
 
@@ -163,22 +179,54 @@ def setpar(key, val, file, delim="=", match_partial=False):
         return value for 'title'. Defaults to False as this can have
         unintended consequences
     """
-    key_out, val_out, i = getpar(key, file, delim, match_partial)
-    if key_out is None:
-        return
+    setpars({key: val}, file, delim, match_partial)
+
+
+def setpars(pars, file, delim="=", match_partial=False):
+    """
+    Overwrites multiple parameter values in a SPECFEM or SeisFlows parameter
+    file, reading and writing the file only once
 
+    :type pars: dict
+    :param pars: case-insensitive keys to match in par_file, and the values
+        to OVERWRITE to each of them
+    :type file: str
+    :param file: The SPECFEM Par_file to match against
+    :type delim: str
+    :param delim: delimiter between parameters and values within the file.
+        default is '=', which matches for SPECFEM2D and SPECFEM3D_Cartesian
+    :type match_partial: bool
+    :param match_partial: allow partial key matches, e.g., allow key='tit' to
+        return value for 'title'. Defaults to False as this can have
+        unintended consequences
+    :rtype: dict
+    :return: the values which were overwritten, keyed by the keys given in
+        `pars`. If multiple keys match the same parameter, each is given the
+        value that it overwrote
+    """
     lines = open(file, "r").readlines()
 
-    # Replace value in place
-    if val_out != "":
-        lines[i] = lines[i].replace(val_out, str(val))
-    else:
-        # Special case where the initial parameter is empty so we just replace
-        # the newline formatter at the end
-        lines[i] = lines[i].replace("\n", f" {val}\n")
+    cur_vals = {}
+    for key, val in pars.items():
+        try:
+            key_out, val_out, i = _getpar(key, lines, delim, match_partial)
+        except KeyError:
+            raise KeyError(f"Could not find matching key '{key}' in file: "
+                           f"{file}") from None
+        # Replace value in place
+        if val_out != "":
+            lines[i] = lines[i].replace(val_out, str(val))
+        else:
+            # Special case where the initial parameter is empty so we just
+            # replace the newline formatter at the end
+            lines[i] = lines[i].replace("\n", f" {val}\n")
+        cur_vals[key] = val_out
+
     with open(file, "w") as f:
         f.writelines(lines)
 
+    return cur_vals
+
 
 def getpar_vel_model(file):
     """
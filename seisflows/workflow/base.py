@@ -160,7 +160,7 @@ class Base:
             conditions are NOT given by the user, start and stop will be 0 and
             -1 respectively, meaning we should execute the ENTIRE list
         """
-        fxnames = [func.__name__ for func in flow]
+        fxidx = {func.__name__: i for i, func in enumerate(flow)}
 
         # Default values which dictate that flow will execute in its entirety
         start_idx = None
@@ -169,12 +169,12 @@ class Base:
         # Overwrite start_idx if RESUME_FROM given, exit condition if no match
         if PAR.RESUME_FROM:
             try:
-                start_idx = fxnames.index(PAR.RESUME_FROM)
+                start_idx = fxidx[PAR.RESUME_FROM]
                 fx_name = flow[start_idx].__name__
                 self.logger.info(
                     msg.mnr(f"WORKFLOW WILL RESUME FROM FUNC: '{fx_name}'")
                 )
-            except ValueError:
+            except KeyError:
                 self.logger.info(
                     msg.cli(f"{PAR.RESUME_FROM} does not correspond to any FLOW "
                             f"functions. Please check that PAR.RESUME_FROM "
@@ -187,13 +187,13 @@ class Base:
         # Overwrite stop_idx if STOP_AFTER provided, exit condition if no match
         if PAR.STOP_AFTER:
             try:
-                stop_idx = fxnames.index(PAR.STOP_AFTER)
+                stop_idx = fxidx[PAR.STOP_AFTER]
                 fx_name = flow[stop_idx].__name__
                 stop_idx += 1  # increment to stop AFTER, due to python indexing
                 self.logger.info(
                     msg.mnr(f"WORKFLOW WILL STOP AFTER FUNC: '{fx_name}'")
                 )
-            except ValueError:
+            except KeyError:
                 self.logger.info(
                     msg.cli(f"{PAR.STOP_AFTER} does not correspond to any FLOW "
                             f"functions. Please check that PAR.STOP_AFTER "
@@ -6,9 +6,9 @@ This is a main Seisflows class, it controls the main workflow.
 """
 import os
 import sys
+import hashlib
 import logging
 import numpy as np
-from glob import glob
 
 from seisflows.config import custom_import, CFGPATHS
 from seisflows.tools import msg, unix
@@ -49,9 +49,23 @@ class Inversion(custom_import("workflow", "base")):
         """
         These parameters should not be set by the user.
         Attributes are initialized as NoneTypes for clarity and docstrings.
+
+        :type _model_hash: str
+        :param _model_hash: SHA-256 hash of the model last written by
+            write_model(), used to identify previously evaluated models
+        :type _misfit_cache: dict
+        :param _misfit_cache: misfit values of the models evaluated during the
+            current line search, keyed by model hash
+        :type _scratch_paths: dict
+        :param _scratch_paths: full paths within the scratch directories that
+            are accessed on every function evaluation, see _scratch_path()
         """
         super().__init__()
 
+        self._model_hash = None
+        self._misfit_cache = {}
+        self._scratch_paths = {}
+
     @property
     def required(self):
         """
@@ -206,6 +220,8 @@ class Inversion(custom_import("workflow", "base")):
             self.logger.info(msg.mjr(f"CONDUCTING LINE SEARCH "
                                      f"({optimize.eval_str})")
                              )
+            # A new (or reset) search may re-run models whose misfit is stale
+            self.clear_misfit_cache()
             optimize.initialize_search()
 
         # Attempt a new trial step with the given step length
@@ -240,6 +256,12 @@ class Inversion(custom_import("workflow", "base")):
         """
         Performs forward simulation, and evaluates the objective function
 
+        .. note::
+            system.run() blocks until all forward simulations have finished.
+            This is intentional: the next trial model (and therefore the next
+            write_model()) depends on the misfit returned here, so there is no
+            independent work that could be overlapped with the simulations
+
         :type path: str
         :param path: path in the scratch directory to use for I/O
         :type suffix: str
@@ -253,11 +275,24 @@ class Inversion(custom_import("workflow", "base")):
 
         self.write_model(path=path, tag=model_tag)
 
+        # Trial models that have already been evaluated during this line search
+        # do not need another forward simulation. Models in PATH.GRAD are
+        # always run as the adjoint simulation requires their synthetics
+        if suffix == "try" and self._model_hash in self._misfit_cache:
+            total_misfit = self._misfit_cache[self._model_hash]
+            self.logger.info(f"model '{model_tag}' previously evaluated, "
+                             f"skipping forward simulation")
+            self.logger.debug(f"saving cached misfit {total_misfit:.3E} to "
+                              f"tag '{misfit_tag}'")
+            optimize.savetxt(misfit_tag, total_misfit)
+            return
+
         self.logger.debug(f"evaluating objective function {PAR.NTASK} times "
                           f"on system...")
         system.run("solver", "eval_func", path=path)
 
         self.write_misfit(path=path, tag=misfit_tag)
+        self._misfit_cache[self._model_hash] = optimize.loadtxt(misfit_tag)
 
     def evaluate_gradient(self, path=None):
         """
@@ -308,6 +343,18 @@ class Inversion(custom_import("workflow", "base")):
         unix.mkdir(PATH.GRAD)
         unix.mkdir(PATH.FUNC)
 
+        # Misfit may be defined differently next iteration (e.g., re-windowing
+        # during preprocessing), so cached values cannot be carried over
+        self.clear_misfit_cache()
+
+    def clear_misfit_cache(self):
+        """
+        Forget the misfits of previously evaluated trial models, so that the
+        next evaluation of any model runs a forward simulation. Called at the
+        start of each line search, and when the line search is reset
+        """
+        self._misfit_cache = {}
+
     def checkpoint(self):
         """
         Writes information to disk so workflow can be resumed following a break
@@ -326,9 +373,13 @@ class Inversion(custom_import("workflow", "base")):
             Expected that these tags are defined in OPTIMIZE module
         """
         src = tag
-        dst = os.path.join(path, "model")
+        dst = self._scratch_path(path, "model")
         self.logger.debug(f"saving model '{src}' to:\n{dst}")
-        solver.save(solver.split(optimize.load(src)), dst)
+        # Memory-map the model, it is only read through once for the hash and
+        # once more when each slice is written, so no in-memory copy is needed
+        model = optimize.load(src, mmap_mode="r")
+        self._model_hash = hashlib.sha256(model).hexdigest()
+        solver.save(solver.split(model), dst)
 
     def write_gradient(self):
         """
@@ -358,13 +409,37 @@ class Inversion(custom_import("workflow", "base")):
             Expected that these tags are defined in OPTIMIZE module
         """
         self.logger.info("summing residuals with preprocess module")
-        src = glob(os.path.join(path, "residuals", "*"))
+        # All files in the residuals directory are collected, no pattern
+        # matching is required so avoid the overhead of glob
+        try:
+            with os.scandir(self._scratch_path(path, "residuals")) as entries:
+                src = sorted(e.path for e in entries
+                             if e.is_file() and not e.name.startswith("."))
+        except FileNotFoundError:
+            src = []
         dst = tag
         total_misfit = preprocess.sum_residuals(src)
 
         self.logger.debug(f"saving misfit {total_misfit:.3E} to tag '{dst}'")
         optimize.savetxt(dst, total_misfit)
 
+    def _scratch_path(self, path, *names):
+        """
+        Join and cache paths within the scratch directories (e.g., PATH.GRAD,
+        PATH.FUNC) so that each path string is only built once per workflow
+
+        :type path: str
+        :param path: scratch directory, e.g., PATH.GRAD or PATH.FUNC
+        :type names: str
+        :param names: path components to join onto `path`
+        :rtype: str
+        :return: joined path
+        """
+        key = (path, *names)
+        if key not in self._scratch_paths:
+            self._scratch_paths[key] = os.path.join(path, *names)
+        return self._scratch_paths[key]
+
     def save_gradient(self):
         """
         Save the gradient vector. Allows saving numpy array or standard
@@ -397,10 +472,11 @@ class Inversion(custom_import("workflow", "base")):
 
         self.logger.debug(f"saving model '{src}' to path:\n{dst}")
 
+        model = optimize.load(src, mmap_mode="r")
         if PAR.SAVEAS in ["binary", "both"]:
-            solver.save(solver.split(optimize.load(src)), dst)
+            solver.save(solver.split(model), dst)
         if PAR.SAVEAS in ["vector", "both"]:
-            np.save(file=dst, arr=optimize.load(src))
+            np.save(file=dst, arr=model)
 
     def save_kernels(self):
         """